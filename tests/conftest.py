@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-import platform
 from typing import TYPE_CHECKING
 
+import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
@@ -18,16 +18,39 @@ from pymatviz.utils.testing import TEST_FILES
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from numpy.typing import ArrayLike
     from phonopy import Phonopy
 
 
-# If platform is Windows, set matplotlib backend to "Agg" to fix:
+# Use non-interactive "Agg" backend on all platforms to skip GUI event loop setup
+# per figure. On Windows this also fixes:
 # "_tkinter.TclError: Can't find a usable init.tcl in the following directories"
 # See: https://github.com/orgs/community/discussions/26434
-if platform.system() == "Windows":
-    import matplotlib as mpl
+mpl.use("Agg", force=True)
 
-    mpl.use("Agg")
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow (e.g. full cartesian parametrizations)",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "slow: only run when --run-slow is passed")
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
 
 
 # random regression data
@@ -45,11 +68,31 @@ df_regr = pd.DataFrame(dict(y_true=y_true, y_pred=y_pred))  # regression
 DfOrArrays = tuple[pd.DataFrame | None, str | np.ndarray, str | np.ndarray]
 
 
-@pytest.fixture(params=[(None, y_true, y_pred), (df_regr, *df_regr.columns[:2])])
+@pytest.fixture(
+    scope="session",
+    params=[(None, y_true, y_pred), (df_regr, *df_regr.columns[:2])],
+)
 def df_or_arrays(request: pytest.FixtureRequest) -> DfOrArrays:
     return request.param
 
 
+def _r2(y_true: ArrayLike, y_pred: ArrayLike) -> float:
+    """Coefficient of determination without sklearn's import and validation cost."""
+    y_true = np.asarray(y_true, dtype=np.float64)
+    residuals = y_true - np.asarray(y_pred, dtype=np.float64)
+    deviations = y_true - y_true.mean()
+    return 1.0 - (residuals @ residuals) / (deviations @ deviations)
+
+
+@pytest.fixture(scope="session")
+def r2_val(df_or_arrays: DfOrArrays) -> float:
+    """R^2 of df_or_arrays, computed once per data realization."""
+    df, x, y = df_or_arrays
+    if isinstance(df, pd.DataFrame):
+        return _r2(df[x].to_numpy(), df[y].to_numpy())
+    return _r2(x, y)
+
+
 df_clf = pd.DataFrame(dict(y_binary=y_binary, y_proba=y_proba))
 df_x_y_clf = [(None, y_binary, y_proba), (df_clf, *df_clf.columns[:2])]
 
@@ -63,7 +106,7 @@ def _run_around_tests() -> Generator[None, None, None]:
     yield
 
     # runs after each test
-    plt.close()
+    plt.close("all")
 
 
 @pytest.fixture
@@ -158,6 +201,28 @@ def _extract_anno_from_fig(fig: go.Figure | plt.Figure) -> str:
     return fig.axes[0].artists[-1].txt.get_text()
 
 
+@pytest.fixture(scope="session")
+def df_tips_session() -> pd.DataFrame:
+    """Plotly's tips dataset, loaded once per session. Don't pass to code under test
+    directly, use the df_tips fixture which returns a copy.
+    """
+    return px.data.tips()
+
+
+@pytest.fixture
+def df_tips(df_tips_session: pd.DataFrame) -> pd.DataFrame:
+    """Fresh copy of the tips dataset so tests can't leak mutations into each other
+    (e.g. density_scatter_plotly adding a bin counts column).
+    """
+    return df_tips_session.copy()
+
+
+@pytest.fixture(scope="session")
+def df_tips_smoker_counts(df_tips_session: pd.DataFrame) -> pd.Series:
+    """Number of rows per smoker category in the tips dataset."""
+    return df_tips_session["smoker"].value_counts()
+
+
 @pytest.fixture(scope="session")
 def phonopy_nacl() -> Phonopy:
     """Return Phonopy class instance of NaCl 2x2x2 without symmetrizing fc2."""
@@ -9,12 +9,11 @@ import numpy as np
 import plotly.graph_objects as go
 import pytest
 from matplotlib.offsetbox import AnchoredText
-from sklearn.metrics import r2_score
 
 import pymatviz as pmv
 from pymatviz.typing import MATPLOTLIB, PLOTLY, Backend
 from pymatviz.utils import pretty_label
-from tests.conftest import _extract_anno_from_fig, y_pred, y_true
+from tests.conftest import _extract_anno_from_fig, _r2, y_pred, y_true
 
 
 if TYPE_CHECKING:
@@ -384,8 +383,7 @@ def test_enhance_parity_plot(
         if shape.type == "line" and shape.x0 != shape.y0
     ]
     if best_fit_line or (
-        best_fit_line is None
-        and r2_score(fig_plotly.data[0].x, fig_plotly.data[0].y) > 0.3
+        best_fit_line is None and _r2(fig_plotly.data[0].x, fig_plotly.data[0].y) > 0.3
     ):
         assert len(best_fit_lines) == 1
         if isinstance(best_fit_line, dict) and "color" in best_fit_line:
@@ -431,7 +429,7 @@ def test_enhance_parity_plot(
             assert plt_identity_line.get_color() == identity_line["color"]
 
     # Check best fit line (should be last line if present)
-    if best_fit_line or (best_fit_line is None and r2_score(xs, ys) > 0.3):
+    if best_fit_line or (best_fit_line is None and _r2(xs, ys) > 0.3):
         plt_best_fit_line = next(
             (ln for ln in lines if not np.allclose(ln.get_xdata(), ln.get_ydata())),
             None,
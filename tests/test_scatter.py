@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING
 
 import matplotlib.pyplot as plt
@@ -7,7 +8,6 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import pytest
-from sklearn.metrics import r2_score
 
 import pymatviz as pmv
 from tests.conftest import df_regr, np_rng
@@ -20,21 +20,28 @@ if TYPE_CHECKING:
 
 
 X_COL, Y_COL, *_ = df_regr
-DF_TIPS = px.data.tips()
 
 
-@pytest.mark.parametrize("log_density", [True, False])
-@pytest.mark.parametrize("hist_density_kwargs", [None, {}, dict(bins=20, sort=True)])
-@pytest.mark.parametrize(
-    "stats",
-    [False, True, dict(prefix="test", loc="lower right", prop=dict(fontsize=10))],
-)
-@pytest.mark.parametrize(
-    "kwargs",
-    [{"cmap": None}, {"cmap": "Greens"}],
-)
-def test_density_scatter_mpl(
+HIST_DENSITY_BINS = dict(bins=20, sort=True)
+STATS_DICT = dict(prefix="test", loc="lower right", prop=dict(fontsize=10))
+# all-pairs covering array over (log_density, hist_density_kwargs, stats, kwargs):
+# every pair of option values appears in at least one case (9 instead of 36 cases)
+DENSITY_SCATTER_MPL_PAIRWISE_CASES = [
+    (True, None, False, {"cmap": None}),
+    (False, None, True, {"cmap": "Greens"}),
+    (True, None, STATS_DICT, {"cmap": None}),
+    (False, {}, False, {"cmap": None}),
+    (True, {}, True, {"cmap": None}),
+    (True, {}, STATS_DICT, {"cmap": "Greens"}),
+    (True, HIST_DENSITY_BINS, False, {"cmap": "Greens"}),
+    (True, HIST_DENSITY_BINS, True, {"cmap": None}),
+    (False, HIST_DENSITY_BINS, STATS_DICT, {"cmap": None}),
+]
+
+
+def _check_density_scatter_mpl(
     df_or_arrays: DfOrArrays,
+    r2_val: float,
     log_density: bool,
     hist_density_kwargs: dict[str, int | bool | str] | None,
     stats: bool | dict[str, Any],
@@ -67,7 +74,6 @@ def test_density_scatter_mpl(
         ]
         assert len(identity_lines) == 1, "Identity line not found"
 
-    r2_val = r2_score(df[x], df[y]) if isinstance(df, pd.DataFrame) else r2_score(x, y)
     if best_fit_line and r2_val > 0.3:
         # Check best fit line exists (navy solid)
         best_fit_lines = [
@@ -75,6 +81,43 @@ def test_density_scatter_mpl(
         ]
         assert len(best_fit_lines) == 1, "Best fit line not found"
 
+    plt.close(ax.figure)
+
+
+@pytest.mark.parametrize(
+    ("log_density", "hist_density_kwargs", "stats", "kwargs"),
+    DENSITY_SCATTER_MPL_PAIRWISE_CASES,
+)
+def test_density_scatter_mpl(
+    df_or_arrays: DfOrArrays,
+    r2_val: float,
+    log_density: bool,
+    hist_density_kwargs: dict[str, int | bool | str] | None,
+    stats: bool | dict[str, Any],
+    kwargs: dict[str, Any],
+) -> None:
+    _check_density_scatter_mpl(
+        df_or_arrays, r2_val, log_density, hist_density_kwargs, stats, kwargs
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("log_density", [True, False])
+@pytest.mark.parametrize("hist_density_kwargs", [None, {}, HIST_DENSITY_BINS])
+@pytest.mark.parametrize("stats", [False, True, STATS_DICT])
+@pytest.mark.parametrize("kwargs", [{"cmap": None}, {"cmap": "Greens"}])
+def test_density_scatter_mpl_full_grid(
+    df_or_arrays: DfOrArrays,
+    r2_val: float,
+    log_density: bool,
+    hist_density_kwargs: dict[str, int | bool | str] | None,
+    stats: bool | dict[str, Any],
+    kwargs: dict[str, Any],
+) -> None:
+    _check_density_scatter_mpl(
+        df_or_arrays, r2_val, log_density, hist_density_kwargs, stats, kwargs
+    )
+
 
 @pytest.mark.parametrize("stats", [1, (1,), "foo"])
 def test_density_scatter_raises_on_bad_stats_type(stats: Any) -> None:
@@ -197,31 +240,32 @@ def test_density_scatter_plotly(
         stats_annotations = [
             ann
             for ann in fig.layout.annotations
-            if any(metric in ann.text for metric in ["MAE", "RMSE", "R<sup>2</sup>"])
+            if any(metric in ann.text for metric in ("MAE", "RMSE", "R<sup>2</sup>"))
         ]
         assert len(stats_annotations) == 1, "Stats annotation not found"
-        assert all(
-            metric in stats_annotations[0].text for metric in ["MAE", "R<sup>2</sup>"]
-        ), f"{stats_annotations[0].text=}"
+        stats_anno = stats_annotations[0]
+        stats_text = stats_anno.text
+        assert "MAE" in stats_text, f"{stats_text=}"
+        assert "R<sup>2</sup>" in stats_text, f"{stats_text=}"
         if isinstance(stats, dict):
             if "prefix" in stats:
-                assert stats_annotations[0].text.startswith(stats["prefix"])
+                assert stats_text.startswith(stats["prefix"])
             if "x" in stats:
-                assert stats_annotations[0].x == stats["x"]
+                assert stats_anno.x == stats["x"]
             if "y" in stats:
-                assert stats_annotations[0].y == stats["y"]
+                assert stats_anno.y == stats["y"]
 
     # Identity and best fit lines are added by default unless explicitly disabled
     identity_line = kwargs.get("identity_line", True)
 
     if identity_line:
         # Check identity line exists (gray dashed)
-        identity_lines = [
-            shape
-            for shape in fig.layout.shapes
-            if shape.line.dash == "dash" and shape.line.color in ("gray", "black")
-        ]
-        assert len(identity_lines) == 1, "Identity line not found"
+        # Classify all lines by style in a single pass over the shapes
+        line_counts = Counter(
+            (shape.line.dash, shape.line.color) for shape in fig.layout.shapes
+        )
+        n_identity_lines = line_counts["dash", "gray"] + line_counts["dash", "black"]
+        assert n_identity_lines == 1, "Identity line not found"
 
 
 def test_density_scatter_plotly_hover_template() -> None:
@@ -243,9 +287,9 @@ def test_density_scatter_plotly_empty_dataframe() -> None:
         pmv.density_scatter_plotly(df=empty_df, x=X_COL, y=Y_COL)
 
 
-def test_density_scatter_plotly_facet() -> None:
+def test_density_scatter_plotly_facet(df_tips: pd.DataFrame) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="smoker"
+        df=df_tips, x="total_bill", y="tip", facet_col="smoker"
     )
 
     assert isinstance(fig, go.Figure)
@@ -253,55 +297,56 @@ def test_density_scatter_plotly_facet() -> None:
     assert fig.layout.xaxis2 is not None  # Check second x-axis exists for faceting
 
 
-def test_density_scatter_plotly_facet_log_density() -> None:
+def test_density_scatter_plotly_facet_log_density(df_tips: pd.DataFrame) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="smoker", log_density=True
+        df=df_tips, x="total_bill", y="tip", facet_col="smoker", log_density=True
     )
 
     assert fig.layout.coloraxis.colorbar.ticktext is not None
     assert fig.layout.coloraxis.colorbar.tickvals is not None
 
 
-def test_density_scatter_plotly_facet_stats() -> None:
+def test_density_scatter_plotly_facet_stats(df_tips: pd.DataFrame) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="smoker", stats=True
+        df=df_tips, x="total_bill", y="tip", facet_col="smoker", stats=True
     )
 
+    annotations = fig.layout.annotations
     # Check there are at least 2 annotations (could be more due to facet labels)
-    assert len(fig.layout.annotations) >= 2
+    assert len(annotations) >= 2
     # Check the stat annotations are present
-    stat_annotations = [ann for ann in fig.layout.annotations if "MAE" in ann.text]
-    assert len(stat_annotations) == 2  # One for each facet
+    n_stat_annotations = sum("MAE" in ann.text for ann in annotations)
+    assert n_stat_annotations == 2  # One for each facet
 
 
-def test_density_scatter_plotly_facet_best_fit_line() -> None:
+def test_density_scatter_plotly_facet_best_fit_line(df_tips: pd.DataFrame) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="smoker", best_fit_line=True
+        df=df_tips, x="total_bill", y="tip", facet_col="smoker", best_fit_line=True
     )
 
+    shapes = fig.layout.shapes
     # Check there are at least 4 shapes (2 identity lines, 2 best fit lines)
-    assert len(fig.layout.shapes) == 4
+    assert len(shapes) == 4
     # Check the best fit lines are present with color navy
-    best_fit_lines = [
-        shape for shape in fig.layout.shapes if shape.line.color == "navy"
-    ]
-    assert len(best_fit_lines) == 2  # One for each facet
+    n_best_fit_lines = sum(shape.line.color == "navy" for shape in shapes)
+    assert n_best_fit_lines == 2  # One for each facet
 
 
-def test_density_scatter_plotly_facet_custom_bins() -> None:
+def test_density_scatter_plotly_facet_custom_bins(
+    df_tips: pd.DataFrame, df_tips_smoker_counts: pd.Series
+) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="smoker", n_bins=10
+        df=df_tips, x="total_bill", y="tip", facet_col="smoker", n_bins=10
     )
 
     # Check that binning has been applied (number of points should be reduced)
-    smoker_count = DF_TIPS["smoker"].value_counts()
-    assert len(fig.data[0].x) < smoker_count["No"]
-    assert len(fig.data[1].x) < smoker_count["Yes"]
+    assert len(fig.data[0].x) < df_tips_smoker_counts["No"]
+    assert len(fig.data[1].x) < df_tips_smoker_counts["Yes"]
 
 
-def test_density_scatter_plotly_facet_custom_color() -> None:
+def test_density_scatter_plotly_facet_custom_color(df_tips: pd.DataFrame) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS,
+        df=df_tips,
         x="total_bill",
         y="tip",
         facet_col="smoker",
@@ -315,44 +360,46 @@ def test_density_scatter_plotly_facet_custom_color() -> None:
 
 @pytest.mark.parametrize("density", ["kde", "empirical"])
 def test_density_scatter_plotly_facet_density_methods(
-    density: Literal["kde", "empirical"],
+    df_tips: pd.DataFrame, density: Literal["kde", "empirical"]
 ) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="smoker", density=density
+        df=df_tips, x="total_bill", y="tip", facet_col="smoker", density=density
     )
 
     assert isinstance(fig, go.Figure)
     # TODO maybe add asserts to check specific aspects of KDE vs empirical density
 
 
-def test_density_scatter_plotly_facet_size() -> None:
+def test_density_scatter_plotly_facet_size(df_tips: pd.DataFrame) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", size="size", facet_col="smoker"
+        df=df_tips, x="total_bill", y="tip", size="size", facet_col="smoker"
     )
 
     assert "marker.size" in fig.data[0]
     assert "marker.size" in fig.data[1]
 
 
-def test_density_scatter_plotly_facet_multiple_categories() -> None:
+def test_density_scatter_plotly_facet_multiple_categories(
+    df_tips: pd.DataFrame,
+) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="day"
+        df=df_tips, x="total_bill", y="tip", facet_col="day"
     )
 
-    assert len(fig.data) == DF_TIPS["day"].nunique()
+    assert len(fig.data) == df_tips["day"].nunique()
 
 
-def test_density_scatter_plotly_facet_identity_line() -> None:
+def test_density_scatter_plotly_facet_identity_line(df_tips: pd.DataFrame) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="smoker", identity_line=True
+        df=df_tips, x="total_bill", y="tip", facet_col="smoker", identity_line=True
     )
 
     assert len(fig.layout.shapes) == 2  # Two identity lines, one for each facet
 
 
-def test_density_scatter_plotly_facet_hover_template() -> None:
+def test_density_scatter_plotly_facet_hover_template(df_tips: pd.DataFrame) -> None:
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", facet_col="smoker"
+        df=df_tips, x="total_bill", y="tip", facet_col="smoker"
     )
 
     for trace in fig.data:
@@ -360,11 +407,11 @@ def test_density_scatter_plotly_facet_hover_template() -> None:
         assert "tip" in trace.hovertemplate
 
 
-def test_density_scatter_plotly_colorbar_kwargs() -> None:
+def test_density_scatter_plotly_colorbar_kwargs(df_tips: pd.DataFrame) -> None:
     colorbar_kwargs = {"title": "Custom Title", "thickness": 30, "len": 0.8, "x": 1.1}
 
     fig = pmv.density_scatter_plotly(
-        df=DF_TIPS, x="total_bill", y="tip", colorbar_kwargs=colorbar_kwargs
+        df=df_tips, x="total_bill", y="tip", colorbar_kwargs=colorbar_kwargs
     )
 
     # Check that colorbar properties were applied correctly